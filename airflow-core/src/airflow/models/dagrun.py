@@ -1518,6 +1518,7 @@ class DagRun(Base, LoggingMixin):
             flag_upstream_failed=True,
             ignore_unmapped_tasks=True,  # Ignore this Dep, as we will expand it if we can.
             finished_tis=finished_tis,
+            logical_date_cache={(self.dag_id, self.run_id): self.logical_date},
         )
 
         def _expand_mapped_task_if_needed(ti: TI) -> Iterable[TI] | None:
@@ -1612,6 +1613,7 @@ class DagRun(Base, LoggingMixin):
             ignore_in_retry_period=True,
             ignore_in_reschedule_period=True,
             finished_tis=finished_tis,
+            logical_date_cache={(self.dag_id, self.run_id): self.logical_date},
         )
         # there might be runnable tasks that are up for retry and for some reason(retry delay, etc.) are
         # not ready yet, so we set the flags to count them in
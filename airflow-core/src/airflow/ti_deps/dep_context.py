@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import contextlib
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 import attr
@@ -67,6 +68,11 @@ class DepContext:
         trigger rule
     :param ignore_ti_state: Ignore the task instance's previous failure/success
     :param finished_tis: A list of all the finished task instances of this run
+    :param logical_date_cache: Logical dates of the dag runs seen in this context, keyed by
+        ``(dag_id, run_id)``, so that dependencies evaluated for many task instances of the
+        same run only need to look the run up once
+    :param now_utc: The current time, taken once when the context is created so that every
+        task instance evaluated in the same pass is compared against the same instant
     """
 
     deps: set = attr.ib(factory=set)
@@ -80,6 +86,8 @@ class DepContext:
     ignore_ti_state: bool = False
     ignore_unmapped_tasks: bool = False
     finished_tis: list[TaskInstance] | None = None
+    logical_date_cache: dict[tuple[str, str], datetime | None] = attr.ib(factory=dict)
+    now_utc: datetime = attr.ib(factory=lambda: datetime.now(timezone.utc))
     description: str | None = None
 
     have_changed_ti_states: bool = False
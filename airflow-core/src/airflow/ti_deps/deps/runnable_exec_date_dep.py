@@ -17,9 +17,15 @@
 # under the License.
 from __future__ import annotations
 
-from airflow._shared.timezones import timezone
 from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
-from airflow.utils.session import provide_session
+
+_IN_FUTURE_REASON = "Logical date {logical_date} is in the future (the current date is {cur_date})."
+_AFTER_TASK_END_DATE_REASON = (
+    "The logical date is {logical_date} but this is after the task's end date {end_date}."
+)
+_AFTER_DAG_END_DATE_REASON = (
+    "The logical date is {logical_date} but this is after the task's DAG's end date {end_date}."
+)
 
 
 class RunnableExecDateDep(BaseTIDep):
@@ -28,34 +34,46 @@ class RunnableExecDateDep(BaseTIDep):
     NAME = "Logical Date"
     IGNORABLE = True
 
-    @provide_session
     def _get_dep_statuses(self, ti, session, dep_context):
-        logical_date = ti.get_dagrun(session).logical_date
+        run_key = (ti.dag_id, ti.run_id)
+        try:
+            logical_date = dep_context.logical_date_cache[run_key]
+        except KeyError:
+            logical_date = dep_context.logical_date_cache[run_key] = ti.get_dagrun(session).logical_date
         if logical_date is None:
             return
 
-        cur_date = timezone.utcnow()
+        task = ti.task
+        task_end_date = task.end_date
+        dag = task.dag
+        dag_end_date = dag.end_date if dag else None
+
+        cur_date = dep_context.now_utc
+        # Only rendered when a check fails, then shared by any further failing checks.
+        logical_date_iso = None
 
         if logical_date > cur_date:
+            logical_date_iso = logical_date.isoformat()
             yield self._failing_status(
-                reason=(
-                    f"Logical date {logical_date.isoformat()} is in the future "
-                    f"(the current date is {cur_date.isoformat()})."
-                )
+                reason=_IN_FUTURE_REASON.format(logical_date=logical_date_iso, cur_date=cur_date.isoformat())
             )
 
-        if ti.task.end_date and logical_date > ti.task.end_date:
+        # Common case: neither the task nor its DAG has an end date to check against.
+        if not task_end_date and not dag_end_date:
+            return
+
+        if task_end_date and logical_date > task_end_date:
+            logical_date_iso = logical_date_iso or logical_date.isoformat()
             yield self._failing_status(
-                reason=(
-                    f"The logical date is {logical_date.isoformat()} but this is "
-                    f"after the task's end date {ti.task.end_date.isoformat()}."
+                reason=_AFTER_TASK_END_DATE_REASON.format(
+                    logical_date=logical_date_iso, end_date=task_end_date.isoformat()
                 )
             )
 
-        if ti.task.dag and ti.task.dag.end_date and logical_date > ti.task.dag.end_date:
+        if dag_end_date and logical_date > dag_end_date:
+            logical_date_iso = logical_date_iso or logical_date.isoformat()
             yield self._failing_status(
-                reason=(
-                    f"The logical date is {logical_date.isoformat()} but this is after "
-                    f"the task's DAG's end date {ti.task.dag.end_date.isoformat()}."
+                reason=_AFTER_DAG_END_DATE_REASON.format(
+                    logical_date=logical_date_iso, end_date=dag_end_date.isoformat()
                 )
             )
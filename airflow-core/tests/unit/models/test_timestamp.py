@@ -19,34 +19,76 @@ from __future__ import annotations
 import pendulum
 import pytest
 import time_machine
-from sqlalchemy import select
+from sqlalchemy import event, select
 
+from airflow import settings
 from airflow._shared.timezones import timezone
 from airflow.models import Log
-from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.utils.session import provide_session
 from airflow.utils.state import State
 
-from tests_common.test_utils.db import clear_db_dags, clear_db_logs, clear_db_runs
+from tests_common.test_utils.db import clear_db_logs
 
 pytestmark = pytest.mark.db_test
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def clear_db():
     clear_db_logs()
-    clear_db_runs()
-    clear_db_dags()
-
-
-def add_log(execdate, session, dag_maker, timezone_override=None):
-    with dag_maker(dag_id="logging", default_args={"start_date": execdate}):
-        task = EmptyOperator(task_id="dummy")
-    dag_run = dag_maker.create_dagrun()
-    task_instance = dag_run.get_task_instance(task.task_id)
-    task_instance.set_state(State.SUCCESS)
-    session.merge(task_instance)
-    log = Log(State.RUNNING, task_instance)
+    yield
+    clear_db_logs()
+
+
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture
+def session():
+    """
+    Bind the scoped session to a single connection whose transaction is rolled back after the test.
+
+    Commits issued by the test (or by code using ``provide_session``) only release a SAVEPOINT, so
+    nothing needs to be deleted between tests.
+    """
+    connection = settings.engine.connect()
+    dbapi_connection = connection.connection.driver_connection
+    is_sqlite = connection.dialect.name == "sqlite"
+    if is_sqlite:
+        # pysqlite never emits BEGIN for connection.begin(), which would make the SAVEPOINT the
+        # outermost transaction and let commit() persist the rows. Disable its own transaction
+        # handling and emit BEGIN explicitly instead.
+        isolation_level = dbapi_connection.isolation_level
+        dbapi_connection.isolation_level = None
+        event.listen(connection, "begin", _emit_begin)
+    transaction = connection.begin()
+    settings.Session.remove()
+    session = settings.Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        settings.Session.remove()
+        transaction.rollback()
+        if is_sqlite:
+            event.remove(connection, "begin", _emit_begin)
+            dbapi_connection.isolation_level = isolation_level
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def ti_key():
+    """
+    The task instance the log rows are written for.
+
+    ``Log`` only copies identifiers from the task instance, so a key shared by the whole module is
+    enough; no DAG or dag run needs to be created for each test.
+    """
+    return TaskInstanceKey(dag_id="logging", task_id="dummy", run_id="test_timestamp")
+
+
+def add_log(ti_key, session, timezone_override=None):
+    log = Log(State.RUNNING, ti_key)
     if timezone_override:
         log.dttm = log.dttm.astimezone(timezone_override)
     session.add(log)
@@ -55,11 +97,11 @@ def add_log(execdate, session, dag_maker, timezone_override=None):
 
 
 @provide_session
-def test_timestamp_behaviour(dag_maker, session):
+def test_timestamp_behaviour(ti_key, session):
     execdate = timezone.utcnow()
     with time_machine.travel(execdate, tick=False):
         current_time = timezone.utcnow()
-        old_log = add_log(execdate, session, dag_maker)
+        old_log = add_log(ti_key, session)
         session.expunge(old_log)
         log_time = session.scalars(select(Log)).one().dttm
         assert log_time == current_time
@@ -67,11 +109,11 @@ def test_timestamp_behaviour(dag_maker, session):
 
 
 @provide_session
-def test_timestamp_behaviour_with_timezone(dag_maker, session):
+def test_timestamp_behaviour_with_timezone(ti_key, session):
     execdate = timezone.utcnow()
     with time_machine.travel(execdate, tick=False):
         current_time = timezone.utcnow()
-        old_log = add_log(execdate, session, dag_maker, timezone_override=pendulum.timezone("Europe/Warsaw"))
+        old_log = add_log(ti_key, session, timezone_override=pendulum.timezone("Europe/Warsaw"))
         session.expunge(old_log)
         # No matter what timezone we set - we should always get back UTC
         log_time = session.scalars(select(Log)).one().dttm
@@ -25,6 +25,7 @@ from sqlalchemy import delete
 
 from airflow._shared.timezones.timezone import datetime
 from airflow.models import DagRun, TaskInstance
+from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.deps.runnable_exec_date_dep import RunnableExecDateDep
 from airflow.utils.types import DagRunType
 
@@ -126,3 +127,20 @@ class TestRunnableExecDateDep:
             logical_date=datetime(2016, 1, 1),
         )
         assert RunnableExecDateDep().is_met(ti=ti)
+
+    def test_logical_date_read_from_dep_context_cache(self):
+        """
+        A logical date cached on the dep context should be used instead of loading the dag run
+        """
+        ti = self._get_task_instance(logical_date=datetime(2016, 1, 1))
+        dep_context = DepContext(logical_date_cache={(ti.dag_id, ti.run_id): datetime(2099, 1, 1)})
+        assert not RunnableExecDateDep().is_met(ti=ti, dep_context=dep_context)
+        ti.get_dagrun.assert_not_called()
+
+    def test_current_date_read_from_dep_context(self):
+        """
+        The current date snapshotted on the dep context should be compared against the logical date
+        """
+        ti = self._get_task_instance(logical_date=datetime(2016, 1, 2))
+        dep_context = DepContext(now_utc=datetime(2016, 1, 1))
+        assert not RunnableExecDateDep().is_met(ti=ti, dep_context=dep_context)
@@ -23,6 +23,7 @@ import io
 import warnings
 from collections import namedtuple
 from collections.abc import Iterable, Mapping, Sequence
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from airflow.exceptions import AirflowProviderDeprecationWarning
@@ -89,6 +90,10 @@ class SqlToS3Operator(BaseOperator):
         Will be ignored if ``groupby_kwargs`` argument is specified.
     :param df_kwargs: arguments to include in DataFrame ``.to_parquet()``, ``.to_json()`` or ``.to_csv()``.
     :param groupby_kwargs: argument to include in DataFrame ``groupby()``.
+    :param read_in_chunks: if ``max_rows_per_file`` is specified, read the data with the hook's
+        ``get_df_by_chunks`` and upload it one file at a time instead of loading the whole result set
+        into memory. For pandas DataFrames, numeric columns of every file are written with the
+        nullable dtypes inferred from the first chunk, so all files share one schema.
     """
 
     template_fields: Sequence[str] = (
@@ -125,6 +130,7 @@ class SqlToS3Operator(BaseOperator):
         df_kwargs: dict | None = None,
         pd_kwargs: dict | None = None,
         groupby_kwargs: dict | None = None,
+        read_in_chunks: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -138,6 +144,7 @@ class SqlToS3Operator(BaseOperator):
         self.parameters = parameters
         self.max_rows_per_file = max_rows_per_file
         self.groupby_kwargs = groupby_kwargs or {}
+        self.read_in_chunks = read_in_chunks
         self.sql_hook_params = sql_hook_params
         self.df_type = df_type
 
@@ -173,11 +180,12 @@ class SqlToS3Operator(BaseOperator):
             raise AirflowException(f"The argument file_format doesn't support {file_format} value.")
 
     @staticmethod
-    def _fix_dtypes(df: pd.DataFrame, file_format: FILE_FORMAT) -> None:
+    def _fix_dtypes(df: pd.DataFrame, file_format: FILE_FORMAT, convert_floats: bool = True) -> None:
         """
         Mutate DataFrame to set dtypes for float columns containing NaN values.
 
         Set dtype of object to str to allow for downstream transformations.
+        Float columns are left untouched if ``convert_floats`` is False.
         """
         try:
             import numpy as np
@@ -188,26 +196,21 @@ class SqlToS3Operator(BaseOperator):
             raise AirflowOptionalProviderFeatureException(e)
 
         for col in df:
-            if df[col].dtype.name == "object" and file_format == FILE_FORMAT.PARQUET:
+            series = df[col]
+            if series.dtype.name == "object" and file_format == FILE_FORMAT.PARQUET:
                 # if the type wasn't identified or converted, change it to a string so if can still be
                 # processed.
-                df[col] = cast("pd.Series", df[col].astype(str))  # type: ignore[call-overload]
+                df[col] = cast("pd.Series", series.astype(str))  # type: ignore[call-overload]
 
-            if "float" in df[col].dtype.name and df[col].hasnans:
+            elif convert_floats and "float" in series.dtype.name and series.hasnans:
                 # inspect values to determine if dtype of non-null values is int or float
-                notna_series: Any = df[col].dropna().values
+                notna_series: Any = series.dropna().values
                 if np.equal(notna_series, notna_series.astype(int)).all():
-                    # set to dtype that retains integers and supports NaNs
-                    # The type ignore can be removed here if https://github.com/numpy/numpy/pull/23690
-                    # is merged and released as currently NumPy does not consider None as valid for x/y.
-                    df[col] = np.where(df[col].isnull(), None, df[col])  # type: ignore[call-overload]
-                    df[col] = cast("pd.Series", df[col].astype(pd.Int64Dtype()))  # type: ignore[call-overload]
+                    # set to dtype that retains integers and supports NaNs, which the cast maps to NA
+                    df[col] = cast("pd.Series", series.astype(pd.Int64Dtype()))  # type: ignore[call-overload]
                 elif np.isclose(notna_series, notna_series.astype(int)).all():
                     # set to float dtype that retains floats and supports NaNs
-                    # The type ignore can be removed here if https://github.com/numpy/numpy/pull/23690
-                    # is merged and released
-                    df[col] = np.where(df[col].isnull(), None, df[col])  # type: ignore[call-overload]
-                    df[col] = cast("pd.Series", df[col].astype(pd.Float64Dtype()))  # type: ignore[call-overload]
+                    df[col] = cast("pd.Series", series.astype(pd.Float64Dtype()))  # type: ignore[call-overload]
 
     @staticmethod
     def _strip_suffixes(
@@ -219,19 +222,20 @@ class SqlToS3Operator(BaseOperator):
                 return path[: -len(suffix)]
         return path
 
+    @cached_property
+    def sql_hook(self) -> DbApiHook:
+        """Create and return the hook used to run the query."""
+        return self._get_hook()
+
+    @cached_property
+    def s3_hook(self) -> S3Hook:
+        """Create and return an S3Hook."""
+        return S3Hook(aws_conn_id=self.aws_conn_id, verify=self.verify)
+
     def execute(self, context: Context) -> None:
-        sql_hook = self._get_hook()
-        s3_conn = S3Hook(aws_conn_id=self.aws_conn_id, verify=self.verify)
-        data_df = sql_hook.get_df(
-            sql=self.query, parameters=self.parameters, df_type=self.df_type, **self.read_kwargs
-        )
-        self.log.info("Data from SQL obtained")
-        # Only apply dtype fixes to pandas DataFrames since Polars doesn't have the same NaN/None inconsistencies as panda
-        if ("dtype_backend", "pyarrow") not in self.read_kwargs.items() and self.df_type == "pandas":
-            self._fix_dtypes(data_df, self.file_format)  # type: ignore[arg-type]
         file_options = FILE_OPTIONS_MAP[self.file_format]
 
-        for group_name, df in self._partition_dataframe(df=data_df):
+        for group_name, df in self._get_partitions():
             buf = io.BytesIO()
             self.log.info("Writing data to in-memory buffer")
             clean_key = self._strip_suffixes(self.s3_key)
@@ -248,19 +252,127 @@ class SqlToS3Operator(BaseOperator):
                     getattr(df, file_options.function)(gz, **df_kwargs)
             else:
                 if self.file_format == FILE_FORMAT.PARQUET:
-                    getattr(df, file_options.function)(buf, **self.df_kwargs)
+                    self._write_parquet(df, buf)
                 else:
                     text_buf = io.TextIOWrapper(buf, encoding="utf-8", write_through=True)
                     getattr(df, file_options.function)(text_buf, **self.df_kwargs)
-                    text_buf.flush()
+                    # Detach rather than just flush, so the in-memory buffer is not closed along with
+                    # the wrapper and stays usable after the upload call.
+                    text_buf.detach()
 
             buf.seek(0)
 
             self.log.info("Uploading data to S3")
-            s3_conn.load_file_obj(
+            self.s3_hook.load_file_obj(
                 file_obj=buf, key=object_key, bucket_name=self.s3_bucket, replace=self.replace
             )
 
+    def _write_parquet(self, df: pd.DataFrame | pl.DataFrame, buf: io.BytesIO) -> None:
+        """
+        Write the dataframe to the buffer as parquet.
+
+        pandas DataFrames are converted and written with pyarrow directly when it is available and
+        all ``df_kwargs`` have a pyarrow equivalent, which skips pandas' engine dispatch. Any other
+        case is left to ``to_parquet()``.
+        """
+        df_kwargs = dict(self.df_kwargs)
+        try:
+            import pandas as pd
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            use_pyarrow = False
+        else:
+            use_pyarrow = (
+                isinstance(df, pd.DataFrame)
+                and not df.attrs
+                and df_kwargs.pop("engine", "pyarrow") in ("pyarrow", "auto")
+                and df_kwargs.keys() <= {"compression", "index", "schema"}
+            )
+
+        if not use_pyarrow:
+            getattr(df, FILE_OPTIONS_MAP[FILE_FORMAT.PARQUET].function)(buf, **self.df_kwargs)
+            return
+
+        # Same mapping as pandas' pyarrow engine: index and schema are used to build the table.
+        from_pandas_kwargs: dict[str, Any] = {"schema": df_kwargs.get("schema")}
+        if df_kwargs.get("index") is not None:
+            from_pandas_kwargs["preserve_index"] = df_kwargs["index"]
+        table = pa.Table.from_pandas(df, **from_pandas_kwargs)
+        pq.write_table(table, buf, compression=df_kwargs.get("compression", "snappy"))
+
+    def _get_partitions(self) -> Iterable[tuple[str, pd.DataFrame | pl.DataFrame]]:
+        """
+        Yield the dataframe to write to each destination file, along with its group name.
+
+        When ``read_in_chunks`` and ``max_rows_per_file`` are set, the result set is streamed one
+        file at a time so that only a single chunk is held in memory.
+        """
+        if self.read_in_chunks and self.max_rows_per_file and not self.groupby_kwargs:
+            if not callable(getattr(self.sql_hook, "get_df_by_chunks", None)):
+                raise AirflowException(
+                    "This hook is not supported with read_in_chunks. "
+                    "The hook class must have get_df_by_chunks method."
+                )
+            chunks = self.sql_hook.get_df_by_chunks(
+                sql=self.query,
+                parameters=self.parameters,
+                chunksize=self.max_rows_per_file,
+                df_type=self.df_type,
+                **self.read_kwargs,
+            )
+            schema = None
+            for index, chunk_df in enumerate(chunks):
+                # An empty result set yields a single empty chunk, which should not be uploaded.
+                if not len(chunk_df):
+                    continue
+                self.log.info("Chunk %s of data from SQL obtained", index)
+                partition_df = chunk_df
+                if self._should_fix_dtypes:
+                    # Whether a float column holds integers can't be decided from one chunk, so only
+                    # the nullable dtypes of the first chunk are applied to every chunk. They are applied
+                    # before the object columns are turned into strings, as a column that is all NULL in
+                    # a later chunk arrives with the object dtype.
+                    if schema is not None:
+                        partition_df = partition_df.astype(schema)  # type: ignore[arg-type]
+                    self._fix_dtypes(partition_df, self.file_format, convert_floats=False)  # type: ignore[arg-type]
+                    if schema is None:
+                        schema = self._nullable_schema(partition_df)  # type: ignore[arg-type]
+                        partition_df = partition_df.astype(schema)  # type: ignore[arg-type]
+                yield cast("str", index), partition_df
+            return
+
+        data_df = self.sql_hook.get_df(
+            sql=self.query, parameters=self.parameters, df_type=self.df_type, **self.read_kwargs
+        )
+        self.log.info("Data from SQL obtained")
+        self._maybe_fix_dtypes(data_df)
+        yield from self._partition_dataframe(df=data_df)
+
+    @property
+    def _should_fix_dtypes(self) -> bool:
+        # Only apply dtype fixes to pandas DataFrames since Polars doesn't have the same NaN/None inconsistencies as panda
+        return ("dtype_backend", "pyarrow") not in self.read_kwargs.items() and self.df_type == "pandas"
+
+    def _maybe_fix_dtypes(self, df: pd.DataFrame | pl.DataFrame) -> None:
+        if self._should_fix_dtypes:
+            self._fix_dtypes(df, self.file_format)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _nullable_schema(df: pd.DataFrame) -> dict:
+        """Map the numeric columns of the DataFrame to the nullable dtypes supporting missing values."""
+        import pandas as pd
+
+        schema: dict = {}
+        for col, dtype in df.dtypes.items():
+            if dtype.kind in "iu":
+                schema[col] = pd.Int64Dtype()
+            elif dtype.kind == "f":
+                schema[col] = pd.Float64Dtype()
+            elif dtype.kind == "b":
+                schema[col] = pd.BooleanDtype()
+        return schema
+
     def _partition_dataframe(
         self, df: pd.DataFrame | pl.DataFrame
     ) -> Iterable[tuple[str, pd.DataFrame | pl.DataFrame]]:
@@ -295,13 +407,15 @@ class SqlToS3Operator(BaseOperator):
             return
 
         if isinstance(df, pd.DataFrame):
-            for group_label in (grouped_df := df.groupby(**self.groupby_kwargs)).groups:
-                group_df = grouped_df.get_group(group_label)
-                if random_column_name:
-                    group_df = group_df.drop(random_column_name, axis=1, errors="ignore")
+            # Compute the row positions of every group once and take them from the frame, rather
+            # than looking each group up again through get_group().
+            group_indices = df.groupby(**self.groupby_kwargs).indices
+            if random_column_name:
+                df = df.drop(random_column_name, axis=1)
+            for group_label, positions in group_indices.items():
                 yield (
                     cast("str", group_label[0] if isinstance(group_label, tuple) else group_label),
-                    group_df.reset_index(drop=True),
+                    df.take(positions).reset_index(drop=True),
                 )
         elif isinstance(df, pl.DataFrame):
             for group_label, group_df_in in df.group_by(**self.groupby_kwargs):  # type: ignore[assignment]
@@ -31,7 +31,33 @@ from airflow.providers.amazon.aws.transfers.sql_to_s3 import SqlToS3Operator
 from airflow.providers.common.compat.sdk import AirflowException
 
 
+@pytest.fixture(scope="module")
+def small_df():
+    return pd.DataFrame({"a": "1", "b": "2"}, index=[0, 1])
+
+
+@pytest.fixture(scope="module")
+def cricket_df():
+    return pd.DataFrame(
+        {
+            "Team": ["Australia", "Australia", "India", "India"],
+            "Player": ["Ricky", "David Warner", "Virat Kohli", "Rohit Sharma"],
+            "Runs": [345, 490, 672, 560],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def dirty_df():
+    return pd.DataFrame({"strings": ["a", "b", None], "ints": [1, 2, None]})
+
+
 class TestSqlToS3Operator:
+    @pytest.fixture(autouse=True)
+    def _patch_s3_hook(self, monkeypatch):
+        self.mock_s3_hook = mock.MagicMock()
+        monkeypatch.setattr("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook", self.mock_s3_hook)
+
     @pytest.mark.parametrize(
         ("file_format", "dtype_backend", "df_kwargs", "expected_key_suffix"),
         [
@@ -47,14 +73,13 @@ class TestSqlToS3Operator:
             ),
         ],
     )
-    @mock.patch("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook")
-    def test_execute_formats(self, mock_s3_hook, file_format, dtype_backend, df_kwargs, expected_key_suffix):
+    def test_execute_formats(self, small_df, file_format, dtype_backend, df_kwargs, expected_key_suffix):
         query = "query"
         s3_bucket = "bucket"
         s3_key = "key"
 
         mock_dbapi_hook = mock.Mock()
-        test_df = pd.DataFrame({"a": "1", "b": "2"}, index=[0, 1])
+        test_df = small_df.copy()
         get_df_mock = mock_dbapi_hook.return_value.get_df
         get_df_mock.return_value = test_df
 
@@ -76,7 +101,7 @@ class TestSqlToS3Operator:
         op._get_hook = mock_dbapi_hook
         op.execute(None)
 
-        mock_s3_hook.assert_called_once_with(aws_conn_id="aws_conn_id", verify=None)
+        self.mock_s3_hook.assert_called_once_with(aws_conn_id="aws_conn_id", verify=None)
 
         expected_df_kwargs = {
             "sql": query,
@@ -88,24 +113,98 @@ class TestSqlToS3Operator:
 
         get_df_mock.assert_called_once_with(**expected_df_kwargs)
 
-        file_obj = mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
+        file_obj = self.mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
         assert isinstance(file_obj, io.BytesIO)
+        assert not file_obj.closed
 
-        mock_s3_hook.return_value.load_file_obj.assert_called_once_with(
+        self.mock_s3_hook.return_value.load_file_obj.assert_called_once_with(
             file_obj=file_obj,
             key=f"{s3_key}{expected_key_suffix}",
             bucket_name=s3_bucket,
             replace=True,
         )
 
-    @mock.patch("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook")
-    def test_execute_gzip_with_bytesio(self, mock_s3_hook):
+    @pytest.mark.parametrize(
+        ("df_kwargs", "expected_compression"),
+        [
+            pytest.param({}, "SNAPPY", id="default-compression"),
+            pytest.param({"compression": "gzip", "index": False}, "GZIP", id="gzip-compression"),
+        ],
+    )
+    def test_execute_parquet_with_pyarrow(self, small_df, df_kwargs, expected_compression):
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        mock_dbapi_hook = mock.Mock()
+        mock_dbapi_hook.return_value.get_df.return_value = small_df.copy()
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key",
+            sql_conn_id="mysql_conn_id",
+            aws_conn_id="aws_conn_id",
+            task_id="task_id",
+            file_format="parquet",
+            df_kwargs=df_kwargs,
+            replace=True,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        op.execute(None)
+
+        file_obj = self.mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
+        parquet_file = pq.ParquetFile(file_obj)
+        assert parquet_file.metadata.row_group(0).column(0).compression == expected_compression
+        file_obj.seek(0)
+        assert pd.read_parquet(file_obj).reset_index(drop=True).equals(small_df)
+
+    @pytest.mark.parametrize(
+        ("df_kwargs_creator", "uses_to_parquet"),
+        [
+            pytest.param(
+                lambda schema: {"index": False, "schema": schema}, False, id="schema-passed-to-from-pandas"
+            ),
+            pytest.param(lambda schema: {"row_group_size": 1}, True, id="unmapped-kwarg-uses-to-parquet"),
+            pytest.param(lambda schema: {"engine": "fastparquet"}, True, id="other-engine-uses-to-parquet"),
+        ],
+    )
+    def test_execute_parquet_df_kwargs(self, small_df, df_kwargs_creator, uses_to_parquet):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        schema = pa.schema([("a", pa.large_string()), ("b", pa.string())])
+        df_kwargs = df_kwargs_creator(schema)
+
+        mock_dbapi_hook = mock.Mock()
+        mock_dbapi_hook.return_value.get_df.return_value = small_df.copy()
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key",
+            sql_conn_id="mysql_conn_id",
+            task_id="task_id",
+            file_format="parquet",
+            df_kwargs=df_kwargs,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        with mock.patch.object(pd.DataFrame, "to_parquet", autospec=True) as mock_to_parquet:
+            op.execute(None)
+
+        if uses_to_parquet:
+            mock_to_parquet.assert_called_once_with(mock.ANY, mock.ANY, **df_kwargs)
+        else:
+            mock_to_parquet.assert_not_called()
+            file_obj = self.mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
+            assert pq.read_schema(file_obj).remove_metadata() == schema
+
+    def test_execute_gzip_with_bytesio(self, small_df):
         query = "query"
         s3_bucket = "bucket"
         s3_key = "key.csv.gz"
 
         mock_dbapi_hook = mock.Mock()
-        test_df = pd.DataFrame({"a": "1", "b": "2"}, index=[0, 1])
+        test_df = small_df.copy()
         get_df_mock = mock_dbapi_hook.return_value.get_df
         get_df_mock.return_value = test_df
 
@@ -123,11 +222,11 @@ class TestSqlToS3Operator:
         op._get_hook = mock_dbapi_hook
         op.execute(None)
 
-        mock_s3_hook.assert_called_once_with(aws_conn_id="aws_conn_id", verify=None)
+        self.mock_s3_hook.assert_called_once_with(aws_conn_id="aws_conn_id", verify=None)
         get_df_mock.assert_called_once_with(sql=query, parameters=None, df_type="pandas")
-        file_obj = mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
+        file_obj = self.mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
         assert isinstance(file_obj, io.BytesIO)
-        mock_s3_hook.return_value.load_file_obj.assert_called_once_with(
+        self.mock_s3_hook.return_value.load_file_obj.assert_called_once_with(
             file_obj=file_obj, key=s3_key, bucket_name=s3_bucket, replace=True
         )
 
@@ -145,7 +244,7 @@ class TestSqlToS3Operator:
             pytest.param({"file_format": "parquet", "null_string_result": "None"}, id="with-parquet"),
         ],
     )
-    def test_fix_dtypes(self, params):
+    def test_fix_dtypes(self, dirty_df, params):
         op = SqlToS3Operator(
             query="query",
             s3_bucket="s3_bucket",
@@ -154,43 +253,11 @@ class TestSqlToS3Operator:
             sql_conn_id="mysql_conn_id",
             file_format=params["file_format"],
         )
-        dirty_df = pd.DataFrame({"strings": ["a", "b", None], "ints": [1, 2, None]})
+        dirty_df = dirty_df.copy()
         op._fix_dtypes(df=dirty_df, file_format=op.file_format)
         assert dirty_df["strings"].values[2] == params["null_string_result"]
         assert dirty_df["ints"].dtype.kind == "i"
 
-    @mock.patch("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook")
-    def test_fix_dtypes_not_called(self, mock_s3_hook):
-        query = "query"
-        s3_bucket = "bucket"
-        s3_key = "key"
-
-        mock_dbapi_hook = mock.Mock()
-        test_df = pd.DataFrame({"a": "1", "b": "2"}, index=[0, 1])
-
-        get_df_mock = mock_dbapi_hook.return_value.get_df
-        get_df_mock.return_value = test_df
-
-        op = SqlToS3Operator(
-            query=query,
-            s3_bucket=s3_bucket,
-            s3_key=s3_key,
-            sql_conn_id="mysql_conn_id",
-            aws_conn_id="aws_conn_id",
-            task_id="task_id",
-            read_kwargs={"dtype_backend": "pyarrow"},
-            file_format="parquet",
-            replace=True,
-            dag=None,
-        )
-
-        op._get_hook = mock_dbapi_hook
-
-        with mock.patch.object(SqlToS3Operator, "_fix_dtypes") as mock_fix_dtypes:
-            op.execute(None)
-
-        mock_fix_dtypes.assert_not_called()
-
     def test_invalid_file_format(self):
         with pytest.raises(AirflowException):
             SqlToS3Operator(
@@ -203,7 +270,7 @@ class TestSqlToS3Operator:
                 dag=None,
             )
 
-    def test_with_groupby_kwarg(self):
+    def test_with_groupby_kwarg(self, cricket_df):
         """
         Test operator when the groupby_kwargs is specified
         """
@@ -223,15 +290,8 @@ class TestSqlToS3Operator:
             groupby_kwargs={"by": "Team"},
             dag=None,
         )
-        example = {
-            "Team": ["Australia", "Australia", "India", "India"],
-            "Player": ["Ricky", "David Warner", "Virat Kohli", "Rohit Sharma"],
-            "Runs": [345, 490, 672, 560],
-        }
-
-        df = pd.DataFrame(example)
         data = []
-        for group_name, df in op._partition_dataframe(df):
+        for group_name, df in op._partition_dataframe(cricket_df.copy()):
             data.append((group_name, df))
         data.sort(key=lambda d: d[0])
         team, df = data[0]
@@ -255,7 +315,7 @@ class TestSqlToS3Operator:
             )
         )
 
-    def test_without_groupby_kwarg(self):
+    def test_without_groupby_kwarg(self, cricket_df):
         """
         Test operator when the groupby_kwargs is not specified
         """
@@ -274,15 +334,8 @@ class TestSqlToS3Operator:
             df_kwargs={"index": False, "header": False},
             dag=None,
         )
-        example = {
-            "Team": ["Australia", "Australia", "India", "India"],
-            "Player": ["Ricky", "David Warner", "Virat Kohli", "Rohit Sharma"],
-            "Runs": [345, 490, 672, 560],
-        }
-
-        df = pd.DataFrame(example)
         data = []
-        for group_name, df in op._partition_dataframe(df):
+        for group_name, df in op._partition_dataframe(cricket_df.copy()):
             data.append((group_name, df))
 
         assert len(data) == 1
@@ -297,7 +350,7 @@ class TestSqlToS3Operator:
             )
         )
 
-    def test_with_max_rows_per_file(self):
+    def test_with_max_rows_per_file(self, cricket_df):
         """
         Test operator when the max_rows_per_file is specified
         """
@@ -317,15 +370,8 @@ class TestSqlToS3Operator:
             max_rows_per_file=3,
             dag=None,
         )
-        example = {
-            "Team": ["Australia", "Australia", "India", "India"],
-            "Player": ["Ricky", "David Warner", "Virat Kohli", "Rohit Sharma"],
-            "Runs": [345, 490, 672, 560],
-        }
-
-        df = pd.DataFrame(example)
         data = []
-        for group_name, df in op._partition_dataframe(df):
+        for group_name, df in op._partition_dataframe(cricket_df.copy()):
             data.append((group_name, df))
         data.sort(key=lambda d: d[0])
         team, df = data[0]
@@ -349,6 +395,175 @@ class TestSqlToS3Operator:
             )
         )
 
+    def test_execute_with_read_in_chunks(self, cricket_df):
+        """
+        Test operator reads and uploads one chunk per file when read_in_chunks is specified
+        """
+        mock_dbapi_hook = mock.Mock()
+        chunks = [cricket_df.iloc[:3].copy(), cricket_df.iloc[3:].copy()]
+        get_df_by_chunks_mock = mock_dbapi_hook.return_value.get_df_by_chunks
+        get_df_by_chunks_mock.return_value = iter(chunks)
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key.csv",
+            sql_conn_id="mysql_conn_id",
+            aws_conn_id="aws_conn_id",
+            task_id="task_id",
+            replace=True,
+            df_kwargs={"index": False},
+            max_rows_per_file=3,
+            read_in_chunks=True,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        op.execute(None)
+
+        get_df_by_chunks_mock.assert_called_once_with(
+            sql="query", parameters=None, chunksize=3, df_type="pandas"
+        )
+        mock_dbapi_hook.return_value.get_df.assert_not_called()
+
+        load_file_obj = self.mock_s3_hook.return_value.load_file_obj
+        assert [call.kwargs["key"] for call in load_file_obj.call_args_list] == ["key.csv", "key_1.csv"]
+        for call, chunk in zip(load_file_obj.call_args_list, chunks, strict=True):
+            read_df = pd.read_csv(call.kwargs["file_obj"])
+            assert read_df.equals(chunk.reset_index(drop=True))
+
+    def test_execute_with_read_in_chunks_keeps_schema_of_first_chunk(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        mock_dbapi_hook = mock.Mock()
+        mock_dbapi_hook.return_value.get_df_by_chunks.return_value = iter(
+            [
+                pd.DataFrame({"real": [1.0, None], "int": [1, 2]}),
+                pd.DataFrame({"real": [2.5, None], "int": [3, None]}),
+            ]
+        )
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key",
+            sql_conn_id="mysql_conn_id",
+            task_id="task_id",
+            file_format="parquet",
+            max_rows_per_file=2,
+            read_in_chunks=True,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        op.execute(None)
+
+        load_file_obj = self.mock_s3_hook.return_value.load_file_obj
+        schemas = [pq.read_schema(call.kwargs["file_obj"]) for call in load_file_obj.call_args_list]
+        assert len(schemas) == 2
+        for schema in schemas:
+            assert str(schema.field("real").type) == "double"
+            assert str(schema.field("int").type) == "int64"
+
+    def test_execute_with_read_in_chunks_all_null_column_in_later_chunk(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        mock_dbapi_hook = mock.Mock()
+        mock_dbapi_hook.return_value.get_df_by_chunks.return_value = iter(
+            [
+                pd.DataFrame({"int": [1, 2], "flag": [True, False]}),
+                pd.DataFrame({"int": [None, None], "flag": [None, None]}, dtype=object),
+            ]
+        )
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key",
+            sql_conn_id="mysql_conn_id",
+            task_id="task_id",
+            file_format="parquet",
+            max_rows_per_file=2,
+            read_in_chunks=True,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        op.execute(None)
+
+        load_file_obj = self.mock_s3_hook.return_value.load_file_obj
+        tables = [pq.read_table(call.kwargs["file_obj"]) for call in load_file_obj.call_args_list]
+        assert len(tables) == 2
+        for table in tables:
+            assert str(table.schema.field("int").type) == "int64"
+            assert str(table.schema.field("flag").type) == "bool"
+        assert tables[1].column("int").null_count == 2
+
+    def test_read_in_chunks_with_groupby_kwargs(self):
+        with pytest.raises(AirflowException, match="can not be both specified"):
+            SqlToS3Operator(
+                query="query",
+                s3_bucket="bucket",
+                s3_key="key",
+                sql_conn_id="mysql_conn_id",
+                task_id="task_id",
+                max_rows_per_file=2,
+                groupby_kwargs={"by": "Team"},
+                read_in_chunks=True,
+                dag=None,
+            )
+
+    def test_execute_with_read_in_chunks_skips_empty_result(self):
+        mock_dbapi_hook = mock.Mock()
+        mock_dbapi_hook.return_value.get_df_by_chunks.return_value = iter([pd.DataFrame({"a": []})])
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key",
+            sql_conn_id="mysql_conn_id",
+            task_id="task_id",
+            max_rows_per_file=2,
+            read_in_chunks=True,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        op.execute(None)
+
+        self.mock_s3_hook.return_value.load_file_obj.assert_not_called()
+
+    def test_execute_with_max_rows_per_file_reads_whole_result_by_default(self, cricket_df):
+        mock_dbapi_hook = mock.Mock()
+        mock_dbapi_hook.return_value.get_df.return_value = cricket_df.copy()
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key.csv",
+            sql_conn_id="mysql_conn_id",
+            task_id="task_id",
+            max_rows_per_file=3,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        op.execute(None)
+
+        mock_dbapi_hook.return_value.get_df_by_chunks.assert_not_called()
+        assert self.mock_s3_hook.return_value.load_file_obj.call_count == 2
+
+    def test_execute_with_read_in_chunks_unsupported_hook(self):
+        mock_dbapi_hook = mock.Mock()
+        mock_dbapi_hook.return_value = mock.Mock(spec=["get_df"])
+
+        op = SqlToS3Operator(
+            query="query",
+            s3_bucket="bucket",
+            s3_key="key",
+            sql_conn_id="mysql_conn_id",
+            task_id="task_id",
+            max_rows_per_file=2,
+            read_in_chunks=True,
+            dag=None,
+        )
+        op._get_hook = mock_dbapi_hook
+        with pytest.raises(AirflowException, match="get_df_by_chunks"):
+            op.execute(None)
+
     @mock.patch("airflow.providers.common.sql.operators.sql.BaseHook.get_connection")
     def test_hook_params(self, mock_get_conn):
         mock_get_conn.return_value = Connection(conn_id="postgres_test", conn_type="postgres")
@@ -374,14 +589,13 @@ class TestSqlToS3Operator:
             pytest.param(None, "pandas", id="with-default"),
         ],
     )
-    @mock.patch("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook")
-    def test_execute_with_df_type(self, mock_s3_hook, df_type_param, expected_df_type):
+    def test_execute_with_df_type(self, small_df, df_type_param, expected_df_type):
         query = "query"
         s3_bucket = "bucket"
         s3_key = "key.csv"
 
         mock_dbapi_hook = mock.Mock()
-        test_df = pd.DataFrame({"a": "1", "b": "2"}, index=[0, 1])
+        test_df = small_df.copy()
         get_df_mock = mock_dbapi_hook.return_value.get_df
         get_df_mock.return_value = test_df
 
@@ -402,11 +616,11 @@ class TestSqlToS3Operator:
         op._get_hook = mock_dbapi_hook
         op.execute(None)
 
-        mock_s3_hook.assert_called_once_with(aws_conn_id="aws_conn_id", verify=None)
+        self.mock_s3_hook.assert_called_once_with(aws_conn_id="aws_conn_id", verify=None)
         get_df_mock.assert_called_once_with(sql=query, parameters=None, df_type=expected_df_type)
-        file_obj = mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
+        file_obj = self.mock_s3_hook.return_value.load_file_obj.call_args[1]["file_obj"]
         assert isinstance(file_obj, io.BytesIO)
-        mock_s3_hook.return_value.load_file_obj.assert_called_once_with(
+        self.mock_s3_hook.return_value.load_file_obj.assert_called_once_with(
             file_obj=file_obj, key=s3_key, bucket_name=s3_bucket, replace=True
         )
 
@@ -518,21 +732,27 @@ class TestSqlToS3Operator:
                 assert op.read_kwargs == expected_read_kwargs
 
     @pytest.mark.parametrize(
-        ("df_type", "should_call_fix_dtypes"),
+        ("df_type", "read_kwargs", "file_format", "should_call_fix_dtypes"),
         [
-            pytest.param("pandas", True, id="pandas-calls-fix-dtypes"),
-            pytest.param("polars", False, id="polars-skips-fix-dtypes"),
+            pytest.param("pandas", {}, "csv", True, id="pandas-calls-fix-dtypes"),
+            pytest.param("polars", {}, "csv", False, id="polars-skips-fix-dtypes"),
+            pytest.param(
+                "pandas",
+                {"dtype_backend": "pyarrow"},
+                "parquet",
+                False,
+                id="pyarrow-backend-skips-fix-dtypes",
+            ),
         ],
     )
-    @mock.patch("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook")
-    def test_fix_dtypes_behavior_by_df_type(self, mock_s3_hook, df_type, should_call_fix_dtypes):
-        """Test that _fix_dtypes is called/not called based on df_type."""
+    def test_fix_dtypes_called(self, small_df, df_type, read_kwargs, file_format, should_call_fix_dtypes):
+        """Test that _fix_dtypes is only called for pandas DataFrames not read with the pyarrow backend."""
         query = "query"
         s3_bucket = "bucket"
         s3_key = "key"
 
         mock_dbapi_hook = mock.Mock()
-        test_df = pd.DataFrame({"a": "1", "b": "2"}, index=[0, 1])
+        test_df = small_df.copy()
         get_df_mock = mock_dbapi_hook.return_value.get_df
         get_df_mock.return_value = test_df
 
@@ -544,6 +764,8 @@ class TestSqlToS3Operator:
             aws_conn_id="aws_conn_id",
             task_id="task_id",
             df_type=df_type,
+            read_kwargs=read_kwargs,
+            file_format=file_format,
             replace=True,
             dag=None,
         )
@@ -626,12 +848,11 @@ class TestSqlToS3Operator:
             ("parquet", {}, "data.parquet"),
         ],
     )
-    @mock.patch("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook")
-    @mock.patch("airflow.providers.common.sql.hooks.sql.DbApiHook")
-    def test_file_format_handling(self, mock_dbapi_hook, mock_s3_hook, fmt, df_kwargs, expected_key):
+    def test_file_format_handling(self, fmt, df_kwargs, expected_key):
         s3_bucket = "bucket"
         s3_key = "data." + fmt
         test_df = pd.DataFrame({"x": [1, 2]})
+        mock_dbapi_hook = mock.Mock()
         mock_dbapi_hook.return_value.get_df.return_value = test_df
 
         op = SqlToS3Operator(
@@ -649,7 +870,7 @@ class TestSqlToS3Operator:
         op._get_hook = lambda: mock_dbapi_hook.return_value
         op.execute(context=None)
 
-        uploaded_key = mock_s3_hook.return_value.load_file_obj.call_args[1]["key"]
+        uploaded_key = self.mock_s3_hook.return_value.load_file_obj.call_args[1]["key"]
         assert uploaded_key == expected_key
 
     @pytest.mark.parametrize(
@@ -663,11 +884,7 @@ class TestSqlToS3Operator:
             ("parquet", {}, ".parquet"),
         ],
     )
-    @mock.patch("airflow.providers.amazon.aws.transfers.sql_to_s3.S3Hook")
-    @mock.patch("airflow.providers.common.sql.hooks.sql.DbApiHook")
-    def test_file_format_handling_with_groupby(
-        self, mock_dbapi_hook, mock_s3_hook, file_format, df_kwargs, expected_suffix
-    ):
+    def test_file_format_handling_with_groupby(self, file_format, df_kwargs, expected_suffix):
         s3_bucket = "bucket"
         s3_key = "data"
 
@@ -676,6 +893,7 @@ class TestSqlToS3Operator:
             {"x": [1, 2, 3, 4, 5, 6], "group": ["group1", "group1", "group2", "group2", "group3", "group4"]}
         )
 
+        mock_dbapi_hook = mock.Mock()
         mock_dbapi_hook.return_value.get_df.return_value = test_data
 
         op = SqlToS3Operator(
@@ -692,13 +910,18 @@ class TestSqlToS3Operator:
             dag=None,
         )
 
-        op._get_hook = lambda: mock_dbapi_hook.return_value
+        op._get_hook = mock_dbapi_hook
         op.execute(context=None)
 
         expected_groups = test_data["group"].unique()
-        assert mock_s3_hook.return_value.load_file_obj.call_count == len(expected_groups)
-
-        called_keys = [call.kwargs["key"] for call in mock_s3_hook.return_value.load_file_obj.call_args_list]
+        assert self.mock_s3_hook.return_value.load_file_obj.call_count == len(expected_groups)
+        # hooks are created once per execution, not once per partition
+        mock_dbapi_hook.assert_called_once_with()
+        self.mock_s3_hook.assert_called_once_with(aws_conn_id="aws_default", verify=None)
+
+        called_keys = [
+            call.kwargs["key"] for call in self.mock_s3_hook.return_value.load_file_obj.call_args_list
+        ]
 
         for group in expected_groups:
             expected_key = f"{s3_key}_{group}{expected_suffix}"